@@ -0,0 +1,39 @@
+"""One-time preprocessing: export each workbook sheet to Parquet.
+
+Parsing the xlsm with openpyxl dominates the app's cold start. Running
+this script once per workbook update writes every sheet the app reads to
+``data/<slug>.parquet`` so the app can load columnar files instead of
+walking the Excel XML. Cell values are stored as strings (nulls kept as
+nulls), which is how the app consumes them anyway.
+
+Usage: python prebuild.py
+"""
+import os
+import re
+
+import pandas as pd
+
+EXCEL_FILE = "Snap Fit  calculation.xlsm"
+DATA_DIR = "data"
+SHEETS = ["Cantilever Snap", '"L" Shaped', '"U" Shaped', "Material Prop Ref."]
+
+
+def sheet_slug(sheet_name):
+    """Turn a sheet name like '"L" Shaped' into a safe filename slug."""
+    return re.sub(r"[^a-z0-9]+", "_", sheet_name.lower()).strip("_")
+
+
+def main():
+    os.makedirs(DATA_DIR, exist_ok=True)
+    xl = pd.ExcelFile(EXCEL_FILE, engine="openpyxl")
+    for sheet_name in SHEETS:
+        df = xl.parse(sheet_name, header=None)
+        df = df.map(lambda v: None if pd.isna(v) else str(v)).astype("string")
+        df.columns = df.columns.astype(str)
+        path = os.path.join(DATA_DIR, f"{sheet_slug(sheet_name)}.parquet")
+        df.to_parquet(path, index=False)
+        print(f"Wrote {path} ({df.shape[0]} rows)")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,162 +1,374 @@
-import streamlit as st
-import pandas as pd
-import os
-
-# ✅ Page setup
-st.set_page_config(page_title="Snap Fit App", layout="wide")
-
-EXCEL_FILE = "Snap Fit  calculation.xlsm"
-SHEET_MAP = {
-    "Cantilever Snap": "Cantilever Snap",
-    "L Shaped Snap": '"L" Shaped',
-    "U Shaped Snap": '"U" Shaped'
-}
-
-@st.cache_data
-def load_sheet(sheet_name):
-    return pd.read_excel(EXCEL_FILE, sheet_name=sheet_name, header=None)
-
-@st.cache_data
-def load_and_format_material_ref(sheet_name="Material Prop Ref."):
-    raw = pd.read_excel(EXCEL_FILE, sheet_name=sheet_name, header=None)
-    raw.dropna(how="all", inplace=True)
-    raw.dropna(axis=1, how="all", inplace=True)
-    raw.columns = raw.iloc[0].astype(str).str.strip()
-    df = raw[1:].reset_index(drop=True)
-    df.columns = df.columns.map(str).str.strip()
-    df = df.astype(str)
-    return df
-
-# -------- Sidebar --------
-st.sidebar.title("📂 Snap Fit Selector")
-snap_type = st.sidebar.selectbox("Select Snap Fit Type", list(SHEET_MAP.keys()))
-sheet_name = SHEET_MAP[snap_type]
-
-# 📷 Sidebar images based on selection
-st.sidebar.markdown("---")
-snap_images = {
-    "Cantilever Snap": ["Q factor selection.png", "Beam Type.png", "Beam.png"],
-    "L Shaped Snap": ["L Shaped snap.png"],
-    "U Shaped Snap": ["U Shaped snap case 1.png", "U Shaped snap case 2.png"]
-}
-for img_file in snap_images.get(snap_type, []):
-    if os.path.exists(img_file):
-        st.sidebar.image(img_file, caption=os.path.splitext(img_file)[0], use_container_width=True)
-    else:
-        st.sidebar.warning(f"⚠️ {img_file} not found")
-
-# -------- Load Excel --------
-df = load_sheet(sheet_name)
-material_ref_df = load_and_format_material_ref()
-st.title("🧩 Snap Fit Design Calculator")
-
-# -------- Inputs --------
-def extract_input_value(df, label):
-    try:
-        return float(df[df[1] == label].iloc[0, 4])
-    except:
-        return 0.0
-
-inputs = {
-    "Flexural Modulus E (GPa)": extract_input_value(df, "Flexural Modulus"),
-    "Permissible Strain ε0 (%)": extract_input_value(df, "Permissible Strain"),
-    "Coefficient of Friction μ": extract_input_value(df, "Coefficient of Friction"),
-    "Beam Thickness t (mm)": extract_input_value(df, "Beam Thickness"),
-    "Beam Length L (mm)": extract_input_value(df, "Beam Length"),
-    "Beam Width b (mm)": extract_input_value(df, "Beam Width"),
-    "Lead Angle α (°)": extract_input_value(df, "Lead Angle"),
-    "Return Angle α′ (°)": extract_input_value(df, "Return Angle"),
-    "Deflection Y (mm)": extract_input_value(df, "Deflection"),
-    "Q Factor": extract_input_value(df, "Q Factor")
-}
-
-# -------- Layout: Inputs + Reference --------
-col_form, col_ref = st.columns([2, 1])
-
-with col_form:
-    with st.form("input_form"):
-        st.header(f"📝 Input Parameters ({snap_type})")
-        user_inputs = {}
-        for label, default_val in inputs.items():
-            user_inputs[label] = st.number_input(label, value=default_val)
-        submitted = st.form_submit_button("🚀 Submit")
-
-with col_ref:
-    st.header("📚 Material Reference")
-
-    center_cols = ["Permissible Strain", "Flexural Modulus", "Coefficient of Friction"]
-    col_styles = []
-    for col in material_ref_df.columns:
-        col_idx = material_ref_df.columns.get_loc(col)
-        col_styles.append({
-            'selector': f'th.col{col_idx}',
-            'props': [('text-align', 'center'), ('font-weight', 'bold')]
-        })
-    col_styles.append({
-        'selector': 'th',
-        'props': [('text-align', 'center'), ('font-weight', 'bold'), ('background-color', '#f0f0f0')]
-    })
-
-    styled_df = material_ref_df.style.set_table_styles(col_styles)
-    for col in material_ref_df.columns:
-        align = 'center' if col.strip() in center_cols else 'left'
-        styled_df = styled_df.set_properties(subset=[col], **{'text-align': align})
-
-    st.markdown(styled_df.to_html(), unsafe_allow_html=True)
-
-# -------- Output Results --------
-if submitted:
-    st.subheader("📄 Output Results")
-
-    def get_output(label_keyword):
-        matches = df[df.apply(lambda row: row.astype(str).str.contains(label_keyword, case=False, na=False).any(), axis=1)]
-        if not matches.empty:
-            return matches.iloc[0].dropna().values[-1]
-        return None
-
-    if snap_type == "Cantilever Snap":
-        output_rows = [
-            ["Max Strain", "ε", "%", get_output("Max Strain")],
-            ["Max Deflection", "Y", "mm", get_output("Max Deflection")],
-            ["Deflection Force", "P", "N", get_output("Deflection Force")],
-            ["Push-on Force", "W", "N", get_output("Push-on Force")],
-            ["Pull-off Force", "W'", "N", get_output("Pull-off Force")]
-        ]
-        df_out = pd.DataFrame(output_rows, columns=["Label", "Symbol", "Unit", "Value"])
-        st.table(df_out)
-
-    elif snap_type == "L Shaped Snap":
-        output_rows = [
-            ["Max Strain", "ε", "%", get_output("Max Strain")],
-            ["Minimum Leg Length", "L2", "mm", "Input Strain"],
-            ["Max Deflection", "Y", "mm", "Input Strain"],
-            ["Deflection Force", "P", "N", get_output("Deflection Force")],
-            ["Deflection Force", "P", "Lbf", get_output("Deflection Force Lbf")],
-        ]
-        df_out = pd.DataFrame(output_rows, columns=["Label", "Symbol", "Unit", "Value"])
-        st.table(df_out)
-
-    elif snap_type == "U Shaped Snap":
-        output_rows = [
-            ["Max Strain", "ε", "%", get_output("Max Strain"), "Input Thickness"],
-            ["Max Deflection", "Y", "mm", get_output("Max Deflection"), "Input Thickness"],
-            ["Deflection Force", "P", "N", get_output("Deflection Force"), "Input Thickness"],
-            ["Deflection Force", "P", "Lbf", get_output("Deflection Force Lbf"), "-"]
-        ]
-        df_out = pd.DataFrame(output_rows, columns=["Label", "Symbol", "Unit", "Case 1", "Case 2"])
-        st.table(df_out)
-
-    # Diagram (optional)
-    st.subheader("📷 Visualization (Optional Diagram)")
-    image_link = None
-    for col in df.columns:
-        if df[col].astype(str).str.contains("http").any():
-            image_link = df[df[col].astype(str).str.contains("http", na=False)].iloc[0, col]
-            break
-    if image_link:
-        st.image(image_link, caption="Snap Fit Diagram", use_column_width=True)
-    else:
-        st.info("No image link found in the sheet.")
-
-# Footer
-st.caption("📘 Snap Fit Engineering Tool · Dynamic Output v4.1")
+import streamlit as st
+import numpy as np
+import pandas as pd
+import os
+from openpyxl import load_workbook
+
+from prebuild import DATA_DIR, sheet_slug
+
+# ✅ Page setup
+st.set_page_config(page_title="Snap Fit App", layout="wide")
+
+EXCEL_FILE = "Snap Fit  calculation.xlsm"
+SHEET_MAP = {
+    "Cantilever Snap": "Cantilever Snap",
+    "L Shaped Snap": '"L" Shaped',
+    "U Shaped Snap": '"U" Shaped'
+}
+
+@st.cache_resource
+def get_workbook():
+    # Open the xlsm once in read-only mode: styles/shared-strings are
+    # streamed lazily instead of parsed eagerly, and the handle is reused
+    # for every sheet.
+    return load_workbook(EXCEL_FILE, read_only=True, data_only=True, keep_links=False)
+
+@st.cache_data(persist="disk")
+def _load_sheet_cached(sheet_name, source_mtime):
+    # Prefer the Parquet files written by prebuild.py: columnar, compressed
+    # and parsed in C, orders of magnitude faster than walking the xlsm.
+    parquet_path = os.path.join(DATA_DIR, f"{sheet_slug(sheet_name)}.parquet")
+    if os.path.exists(parquet_path):
+        df = pd.read_parquet(parquet_path)
+        df.columns = range(df.shape[1])
+        return df
+    ws = get_workbook()[sheet_name]
+    return pd.DataFrame(ws.values)
+
+def load_sheet(sheet_name):
+    # The workbook mtime is part of the cache key, so the disk-persisted
+    # entries survive restarts but invalidate when the xlsm is replaced.
+    return _load_sheet_cached(sheet_name, os.path.getmtime(EXCEL_FILE))
+
+@st.cache_data
+def load_sheet_str(sheet_name):
+    # One stringified copy per sheet, shared by every text scan instead
+    # of re-running astype(str) at each use site.
+    return load_sheet(sheet_name).fillna("").astype(str)
+
+@st.cache_data(persist="disk")
+def _material_ref_cached(sheet_name, source_mtime):
+    raw = load_sheet(sheet_name)
+    raw.dropna(how="all", inplace=True)
+    raw.dropna(axis=1, how="all", inplace=True)
+    raw.columns = raw.iloc[0].astype(str).str.strip()
+    df = raw[1:].reset_index(drop=True)
+    df.columns = df.columns.map(str).str.strip()
+    df = df.astype(str)
+    return df
+
+def load_and_format_material_ref(sheet_name="Material Prop Ref."):
+    return _material_ref_cached(sheet_name, os.path.getmtime(EXCEL_FILE))
+
+# -------- Sidebar --------
+st.sidebar.title("📂 Snap Fit Selector")
+snap_type = st.sidebar.selectbox("Select Snap Fit Type", list(SHEET_MAP.keys()))
+sheet_name = SHEET_MAP[snap_type]
+
+@st.cache_resource
+def available_images():
+    # One listdir at startup instead of a stat per image per rerun.
+    return set(os.listdir("."))
+
+@st.cache_resource
+def load_image_bytes(path):
+    # Keep the small fixed set of sidebar PNGs in memory so reruns don't
+    # re-read them from disk.
+    with open(path, "rb") as f:
+        return f.read()
+
+# 📷 Sidebar images based on selection
+st.sidebar.markdown("---")
+snap_images = {
+    "Cantilever Snap": ["Q factor selection.png", "Beam Type.png", "Beam.png"],
+    "L Shaped Snap": ["L Shaped snap.png"],
+    "U Shaped Snap": ["U Shaped snap case 1.png", "U Shaped snap case 2.png"]
+}
+for img_file in snap_images.get(snap_type, []):
+    if img_file in available_images():
+        st.sidebar.image(load_image_bytes(img_file), caption=os.path.splitext(img_file)[0], use_container_width=True)
+    else:
+        st.sidebar.warning(f"⚠️ {img_file} not found")
+
+st.title("🧩 Snap Fit Design Calculator")
+
+# -------- Inputs --------
+@st.cache_data
+def label_values(sheet_name):
+    # The sheet's label column indexed against its value column: the
+    # index is built once per sheet and any label lookup afterwards is an
+    # O(1) .get() instead of a boolean-mask scan.
+    df = load_sheet(sheet_name)
+    s = pd.to_numeric(df.set_index(1)[4], errors="coerce")
+    # Some sheets repeat a label with an empty value row; keep the first
+    # occurrence like the old per-label lookup did.
+    return s[~s.index.duplicated(keep="first")].fillna(0.0)
+
+@st.cache_data
+def build_defaults(sheet_name):
+    return label_values(sheet_name).to_dict()
+
+# Form field label -> label in the sheet's input column.
+FIELD_MAP = {
+    "Flexural Modulus E (GPa)": "Flexural Modulus",
+    "Permissible Strain ε0 (%)": "Permissible Strain",
+    "Coefficient of Friction μ": "Coefficient of Friction",
+    "Beam Thickness t (mm)": "Beam Thickness",
+    "Beam Length L (mm)": "Beam Length",
+    "Beam Width b (mm)": "Beam Width",
+    "Lead Angle α (°)": "Lead Angle",
+    "Return Angle α′ (°)": "Return Angle",
+    "Deflection Y (mm)": "Deflection",
+    "Beam Type": "Beam Type",
+    "Q Factor": "Q Factor"
+}
+
+@st.cache_data
+def defaults_for(snap_type):
+    # The finished field->default dict, cached per snap type so reruns
+    # skip even the dict assembly.
+    defaults = build_defaults(SHEET_MAP[snap_type])
+    return {label: defaults.get(sheet_label, 0.0) for label, sheet_label in FIELD_MAP.items()}
+
+@st.cache_data
+def material_ref_html():
+    # The reference table is static, so build the Styler and its HTML once
+    # instead of on every rerun.
+    ref_df = load_and_format_material_ref()
+
+    center_cols = ["Permissible Strain", "Flexural Modulus", "Coefficient of Friction"]
+    col_styles = []
+    for col in ref_df.columns:
+        col_idx = ref_df.columns.get_loc(col)
+        col_styles.append({
+            'selector': f'th.col{col_idx}',
+            'props': [('text-align', 'center'), ('font-weight', 'bold')]
+        })
+    col_styles.append({
+        'selector': 'th',
+        'props': [('text-align', 'center'), ('font-weight', 'bold'), ('background-color', '#f0f0f0')]
+    })
+
+    center_set = [c for c in ref_df.columns if c.strip() in center_cols]
+    left_set = [c for c in ref_df.columns if c.strip() not in center_cols]
+    styled_df = (
+        ref_df.style
+        .set_table_styles(col_styles)
+        .set_properties(subset=center_set, **{'text-align': 'center'})
+        .set_properties(subset=left_set, **{'text-align': 'left'})
+    )
+
+    return styled_df.to_html()
+
+# -------- Calculations --------
+# Beam-type coefficient, as in the workbook: 1 = full height, 2 = tapered
+# height, 3 = tapered width.
+BEAM_TYPE_COEFF = {1: 1.5, 2: 0.92, 3: 1.17}
+
+# Q-factor interpolation curves from the workbook, one (L/t, Q) table per
+# style; the Q Factor input selects the style, exactly like the sheet's
+# dropdown.
+Q_FACTOR_TABLES = {
+    1: ((1.5, 2.0, 2.5, 3.0, 3.5, 4.0, 5.0, 6.0, 7.0, 8.0, 9.0, 10.0, 11.0),
+        (1.56, 1.34, 1.21, 1.15, 1.125, 1.1, 1.08, 1.05, 1.03, 1.02, 1.01, 1.005, 1.0)),
+    2: ((1.5, 2.0, 2.5, 3.0, 3.5, 4.0, 5.0, 6.0, 7.0, 8.0, 9.0, 10.0, 11.0),
+        (2.15, 1.7, 1.45, 1.34, 1.28, 1.25, 1.2, 1.17, 1.11, 1.1, 1.07, 1.06, 1.055)),
+    3: ((1.5, 2.0, 2.5, 3.0, 3.5, 4.0, 5.0, 6.0, 7.0, 8.0, 9.0, 10.0, 11.0),
+        (2.3, 1.85, 1.6, 1.45, 1.38, 1.34, 1.3, 1.25, 1.2, 1.16, 1.11, 1.1, 1.09)),
+    4: ((1.5, 2.0, 2.5, 3.0, 3.5, 4.0, 5.0, 6.0, 7.0, 8.0, 9.0, 10.0, 11.0),
+        (6.5, 4.5, 3.35, 2.8, 2.4, 2.2, 1.93, 1.75, 1.62, 1.53, 1.45, 1.38, 1.3)),
+    5: ((1.5, 2.0, 2.5, 3.0, 3.5, 4.0, 5.0, 6.0, 7.0, 8.0, 9.0, 10.0, 11.0),
+        (8.0, 5.5, 3.9, 3.11, 2.6, 2.34, 2.0, 1.85, 1.7, 1.6, 1.55, 1.48, 1.42)),
+    "2T": ((2.0, 2.5, 3.0, 3.5, 4.0, 5.0, 6.0, 7.0, 8.0, 9.0, 10.0, 11.0),
+           (1.6, 1.48, 1.35, 1.27, 1.25, 1.2, 1.18, 1.15, 1.11, 1.08, 1.05, 1.1)),
+    "5T": ((2.0, 2.5, 3.0, 3.5, 4.0, 5.0, 6.0, 7.0, 8.0, 9.0, 10.0, 11.0),
+           (3.5, 2.92, 2.48, 2.21, 2.03, 1.75, 1.6, 1.5, 1.4, 1.38, 1.33, 1.3)),
+}
+
+def q_factor(L_over_t, style):
+    """Q deflection-magnification factor for the given style curve,
+    linearly interpolated at L/t like the workbook's lookup tables."""
+    knots, values = Q_FACTOR_TABLES[style]
+    return np.interp(L_over_t, knots, values)
+
+def calculate_cantilever_snap(E, permissible_strain, mu, t, L, b, alpha, alpha_prime, y,
+                              beam_type, q_style):
+    """Closed-form cantilever snap-fit results, following the workbook.
+
+    The numeric arguments accept scalars or NumPy arrays of the same
+    shape, so a parameter sweep can be evaluated in one vectorized call;
+    scalar inputs come back as plain floats. beam_type (1-3) and q_style
+    (1-5, "2T" or "5T") are the sheet's selector inputs and must be
+    scalars; unknown selectors raise KeyError.
+
+    E in GPa, permissible_strain in %, angles in degrees, lengths in mm.
+    """
+    E, permissible_strain, mu, t, L, b, alpha, alpha_prime, y = (
+        np.asarray(v, dtype=float)
+        for v in (E, permissible_strain, mu, t, L, b, alpha, alpha_prime, y)
+    )
+    k = BEAM_TYPE_COEFF[int(beam_type)]
+    q = q_factor(L / t, q_style if isinstance(q_style, str) else int(q_style))
+    # One tan per angle and one reciprocal of L^2, shared below; the unit
+    # conversions (GPa->MPa, percent) are pre-folded so each result is a
+    # single multiply chain.
+    tan_alpha = np.tan(np.radians(alpha))
+    tan_alpha_prime = np.tan(np.radians(alpha_prime))
+    inv_L2 = 1.0 / (L * L)
+
+    strain_percent = 100.0 * k * y * t * inv_L2 / q
+    max_deflection = 0.01 * permissible_strain * q * L * L / (k * t)
+    deflection_force = b * t * t * E * permissible_strain / (0.6 * L * q)
+    push_on_force = deflection_force * (mu + tan_alpha) / (1.0 - mu * tan_alpha)
+    pull_off_force = deflection_force * (mu + tan_alpha_prime) / (1.0 - mu * tan_alpha_prime)
+
+    results = {
+        "Max Strain": strain_percent,
+        "Max Deflection": max_deflection,
+        "Deflection Force": deflection_force,
+        "Push-on Force": push_on_force,
+        "Pull-off Force": pull_off_force,
+    }
+    return {k: (v.item() if np.ndim(v) == 0 else v) for k, v in results.items()}
+
+# -------- Output Results --------
+OUTPUT_KEYWORDS = (
+    "Max Strain", "Max Deflection", "Deflection Force",
+    "Deflection Force Lbf", "Push-on Force", "Pull-off Force"
+)
+
+@st.cache_data
+def build_outputs(sheet_name):
+    # One vectorized contains() per keyword over the stacked sheet instead
+    # of a Python-level apply(axis=1) loop per output label.
+    df = load_sheet(sheet_name)
+    # Join each row's cells with a separator no keyword can span, so one
+    # contains() per keyword replaces the per-cell stacked scan.
+    joined = load_sheet_str(sheet_name).agg("\x1f".join, axis=1)
+    results = {}
+    for kw in OUTPUT_KEYWORDS:
+        mask = joined.str.contains(kw, case=False, regex=False)
+        rows = df.index[mask]
+        if len(rows):
+            first_row = df.loc[rows[0]].dropna()
+            results[kw] = first_row.values[-1] if len(first_row) else None
+        else:
+            results[kw] = None
+    return results
+
+@st.cache_data
+def find_image_link(sheet_name):
+    # Single vectorized scan for an embedded URL, column-major like the
+    # old per-column loop, cached across reruns.
+    flat = load_sheet_str(sheet_name).T.stack()
+    hits = flat[flat.str.contains("http", regex=False)]
+    return hits.iloc[0] if not hits.empty else None
+
+def render_output_table(columns, rows):
+    # The output tables are a handful of rows: building the HTML directly
+    # skips DataFrame construction and Arrow serialization on each submit.
+    head = "".join(f"<th style='text-align:left;padding:4px 12px'>{c}</th>" for c in columns)
+    body = "".join(
+        "<tr>" + "".join(
+            f"<td style='padding:4px 12px'>{'' if v is None else v}</td>" for v in row
+        ) + "</tr>"
+        for row in rows
+    )
+    st.markdown(
+        f"<table><thead><tr>{head}</tr></thead><tbody>{body}</tbody></table>",
+        unsafe_allow_html=True
+    )
+
+def render_cantilever_outputs(user_inputs, outputs):
+    try:
+        results = calculate_cantilever_snap(
+            E=user_inputs["Flexural Modulus E (GPa)"],
+            permissible_strain=user_inputs["Permissible Strain ε0 (%)"],
+            mu=user_inputs["Coefficient of Friction μ"],
+            t=user_inputs["Beam Thickness t (mm)"],
+            L=user_inputs["Beam Length L (mm)"],
+            b=user_inputs["Beam Width b (mm)"],
+            alpha=user_inputs["Lead Angle α (°)"],
+            alpha_prime=user_inputs["Return Angle α′ (°)"],
+            y=user_inputs["Deflection Y (mm)"],
+            beam_type=user_inputs["Beam Type"],
+            q_style=user_inputs["Q Factor"]
+        )
+    except KeyError:
+        st.error("⚠️ Beam Type must be 1-3 and Q Factor must select a style from 1-5.")
+        return
+    output_rows = [
+        ["Max Strain", "ε", "%", results["Max Strain"]],
+        ["Max Deflection", "Y", "mm", results["Max Deflection"]],
+        ["Deflection Force", "P", "N", results["Deflection Force"]],
+        ["Push-on Force", "W", "N", results["Push-on Force"]],
+        ["Pull-off Force", "W'", "N", results["Pull-off Force"]]
+    ]
+    render_output_table(["Label", "Symbol", "Unit", "Value"], output_rows)
+
+def render_l_outputs(user_inputs, outputs):
+    output_rows = [
+        ["Max Strain", "ε", "%", outputs.get("Max Strain")],
+        ["Minimum Leg Length", "L2", "mm", "Input Strain"],
+        ["Max Deflection", "Y", "mm", "Input Strain"],
+        ["Deflection Force", "P", "N", outputs.get("Deflection Force")],
+        ["Deflection Force", "P", "Lbf", outputs.get("Deflection Force Lbf")],
+    ]
+    render_output_table(["Label", "Symbol", "Unit", "Value"], output_rows)
+
+def render_u_outputs(user_inputs, outputs):
+    output_rows = [
+        ["Max Strain", "ε", "%", outputs.get("Max Strain"), "Input Thickness"],
+        ["Max Deflection", "Y", "mm", outputs.get("Max Deflection"), "Input Thickness"],
+        ["Deflection Force", "P", "N", outputs.get("Deflection Force"), "Input Thickness"],
+        ["Deflection Force", "P", "Lbf", outputs.get("Deflection Force Lbf"), "-"]
+    ]
+    render_output_table(["Label", "Symbol", "Unit", "Case 1", "Case 2"], output_rows)
+
+OUTPUT_RENDERERS = {
+    "Cantilever Snap": render_cantilever_outputs,
+    "L Shaped Snap": render_l_outputs,
+    "U Shaped Snap": render_u_outputs
+}
+
+# -------- Form + Outputs --------
+@st.fragment
+def calc_panel(snap_type, sheet_name):
+    # Submitting the form reruns only this fragment: the sidebar, image
+    # checks and material-reference panel are left untouched.
+    inputs = defaults_for(snap_type)
+
+    with st.form("input_form"):
+        st.header(f"📝 Input Parameters ({snap_type})")
+        user_inputs = {}
+        for label, default_val in inputs.items():
+            user_inputs[label] = st.number_input(label, value=default_val)
+        submitted = st.form_submit_button("🚀 Submit")
+
+    if not submitted:
+        return
+
+    st.subheader("📄 Output Results")
+
+    OUTPUT_RENDERERS[snap_type](user_inputs, build_outputs(sheet_name))
+
+    # Diagram (optional)
+    st.subheader("📷 Visualization (Optional Diagram)")
+    image_link = find_image_link(sheet_name)
+    if image_link:
+        st.image(image_link, caption="Snap Fit Diagram", use_column_width=True)
+    else:
+        st.info("No image link found in the sheet.")
+
+# -------- Layout: Inputs + Reference --------
+col_form, col_ref = st.columns([2, 1])
+
+with col_form:
+    calc_panel(snap_type, sheet_name)
+
+with col_ref:
+    st.header("📚 Material Reference")
+    st.markdown(material_ref_html(), unsafe_allow_html=True)
+
+# Footer
+st.caption("📘 Snap Fit Engineering Tool · Dynamic Output v4.1")